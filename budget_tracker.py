@@ -3,44 +3,390 @@ Budget Tracker Module
 """
 
 import os
+import re
 import csv
-from datetime import datetime
+import calendar
+from collections import Counter, defaultdict
+from functools import lru_cache
+from datetime import datetime, date, timedelta
 import tkinter as tk
-from tkinter import ttk, simpledialog, messagebox
+from tkinter import ttk, simpledialog, messagebox, filedialog
 from openpyxl import Workbook, load_workbook
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 import pdb  # Importing pdb for debugging
 
-# Global variables for workbook and worksheet
+# Global variables for workbook and worksheets
 WB = None
 WS = None
+RECURRING_WS = None
+
+# Number of months projected past the current month on the balance chart
+FORECAST_MONTHS = 12
+
+# Recurring frequencies and the step (in days) of the non-monthly ones;
+# monthly templates step by calendar month instead.
+FREQUENCIES = ["Monthly", "Weekly", "Daily"]
+FREQUENCY_DAYS = {"Weekly": 7, "Daily": 1}
+
+# Category lookup indexes learned from the ledger: normalized description -> category
+# counts, and description token -> category counts
+MERCHANT_INDEX = defaultdict(Counter)
+TOKEN_INDEX = defaultdict(Counter)
+
+# Maximum number of distinct merchant strings kept in the suggestion cache
+SUGGESTION_CACHE_SIZE = 4096
+
+# Ledger column that marks rows posted from a recurring template
+RECURRING_FLAG_COLUMN = 5
+
+# Ledger column that marks rows whose category was filled in automatically;
+# cleared once the user edits the category
+SUGGESTED_FLAG_COLUMN = 6
+
+RECURRING_HEADER = ["Description", "Amount", "Category", "Frequency", "Interval",
+                    "Start Date", "End Date", "Last Posted"]
 
 def setup_excel():
     """Creates and/or loads the Excel workbook."""
-    global WB, WS
+    global WB, WS, RECURRING_WS
     if not os.path.exists("input_data.xlsx"):
         WB = Workbook()
         WS = WB.active
         WS.title = "Data Input"
         WS.append(["Description", "Amount", "Category", "Date"])
-        WB.save("input_data.xlsx")
     else:
         WB = load_workbook("input_data.xlsx")
         WS = WB.active
+    WS.cell(row=1, column=RECURRING_FLAG_COLUMN, value="Recurring")
+    WS.cell(row=1, column=SUGGESTED_FLAG_COLUMN, value="Suggested")
+    if "Recurring" not in WB.sheetnames:
+        RECURRING_WS = WB.create_sheet("Recurring")
+        RECURRING_WS.append(RECURRING_HEADER)
+    else:
+        RECURRING_WS = WB["Recurring"]
+    WB.save("input_data.xlsx")
 
 setup_excel()
 
+def parse_date(value):
+    """Parses an MM/DD/YYYY string or an Excel date cell into a date, returning None if empty."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value).strip(), "%m/%d/%Y").date()
+
+def add_months(start, months):
+    """Adds months to a date, clamping the day to the end of the month."""
+    month_index = start.year * 12 + start.month - 1 + months
+    year, month = divmod(month_index, 12)
+    day = min(start.day, calendar.monthrange(year, month + 1)[1])
+    return date(year, month + 1, day)
+
+def occurrence_dates(template, after, until):
+    """Returns the dates a recurring template falls on in (after, until]."""
+    _, _, _, frequency, interval, start, end, _ = template
+    if end is not None:
+        until = min(until, end)
+    # Jump straight to the first step after `after` instead of walking from the start
+    if frequency == "Monthly":
+        months = (after.year - start.year) * 12 + after.month - start.month
+        step = max(months // interval, 0)
+        while add_months(start, step * interval) <= after:
+            step += 1
+    else:
+        step_days = interval * FREQUENCY_DAYS[frequency]
+        step = max((after - start).days // step_days + 1, 0)
+
+    dates = []
+    current = occurrence_at(template, step)
+    while current <= until:
+        dates.append(current)
+        step += 1
+        current = occurrence_at(template, step)
+    return dates
+
+def occurrence_at(template, step):
+    """Returns the date of a recurring template's step-th occurrence."""
+    _, _, _, frequency, interval, start, _, _ = template
+    if frequency == "Monthly":
+        # Step from the start date so a day-31 template doesn't drift to day 28
+        return add_months(start, step * interval)
+    return start + timedelta(days=step * interval * FREQUENCY_DAYS[frequency])
+
+def read_recurring():
+    """Reads the recurring templates as (row number, template) pairs."""
+    templates = []
+    for row_number, row in enumerate(RECURRING_WS.iter_rows(min_row=2, values_only=True), start=2):
+        if not row[0] or row[3] not in FREQUENCIES:
+            continue
+        try:
+            template = (
+                row[0],  # Description
+                float(row[1]),  # Amount
+                row[2],  # Category
+                row[3],  # Frequency
+                max(int(row[4] or 1), 1),  # Interval
+                parse_date(row[5]),  # Start Date
+                parse_date(row[6]),  # End Date
+                parse_date(row[7])   # Last Posted
+            )
+        except (TypeError, ValueError):
+            continue  # Skip rows hand-edited into something we can't read
+        if template[5] is not None:
+            templates.append((row_number, template))
+    return templates
+
+def normalize_description(description):
+    """Lowercases a description and strips punctuation and store numbers.
+
+    Only digit runs that look like store or reference numbers ("#1234", dates,
+    three or more digits on their own) are dropped, so merchant names such as
+    "7-Eleven" or "Shell 76" keep their digits.
+    """
+    text = re.sub(r"#\s*\d+|\b\d+[/-]\d+(?:[/-]\d+)?\b|\b\d{3,}\b", " ",
+                  str(description).lower())
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+def _index_description(description, category, weight):
+    """Adds (or with a negative weight, removes) a row from the category indexes."""
+    merchant = normalize_description(description)
+    if not merchant or not category:
+        return
+    keys = [(MERCHANT_INDEX, merchant)]
+    keys += [(TOKEN_INDEX, token) for token in set(merchant.split())]
+    for index, key in keys:
+        index[key][category] += weight
+        if index[key][category] <= 0:
+            del index[key][category]
+            if not index[key]:
+                del index[key]
+
+def index_row(description, category, weight=1):
+    """Updates the category indexes for one added, edited, or deleted ledger row."""
+    _index_description(description, category, weight)
+    _suggest_for_merchant.cache_clear()
+
+def is_suggested(row_number):
+    """Returns whether a ledger row's category was filled in automatically."""
+    return bool(WS.cell(row=row_number, column=SUGGESTED_FLAG_COLUMN).value)
+
+def build_category_index():
+    """Builds the category indexes from the ledger.
+
+    Rows whose category was filled in automatically are skipped until the user
+    edits their category, so the indexes never learn from their own guesses.
+    """
+    MERCHANT_INDEX.clear()
+    TOKEN_INDEX.clear()
+    for row in WS.iter_rows(min_row=2, max_col=SUGGESTED_FLAG_COLUMN, values_only=True):
+        if not row[5]:
+            _index_description(row[0], row[2], 1)
+    _suggest_for_merchant.cache_clear()
+
+@lru_cache(maxsize=SUGGESTION_CACHE_SIZE)
+def _suggest_for_merchant(merchant):
+    """Ranks the categories matching a normalized description, best first."""
+    if merchant in MERCHANT_INDEX:
+        return tuple(category for category, _ in MERCHANT_INDEX[merchant].most_common())
+    scores = Counter()
+    for token in set(merchant.split()):
+        counts = TOKEN_INDEX.get(token)
+        if not counts:
+            continue
+        # Each token gets one vote, split by how its rows were categorized,
+        # so common words like "the" don't outweigh a distinctive merchant name
+        total = sum(counts.values())
+        for category, count in counts.items():
+            scores[category] += count / total
+    return tuple(category for category, _ in scores.most_common())
+
+def suggest_category(description, income=False):
+    """Suggests a category for a description, or None if nothing matches.
+
+    Income is always categorized as "Income", and expenses never are, so a
+    suggestion can't flip the sign of an amount.
+    """
+    if income:
+        return "Income"
+    for category in _suggest_for_merchant(normalize_description(description)):
+        if category.lower() != "income":
+            return category
+    return None
+
+build_category_index()
+
+def materialize_recurring():
+    """Posts recurring transactions that have come due since they were last posted."""
+    today = date.today()
+    posted = 0
+    for row_number, template in read_recurring():
+        description, amount, category, _, _, start, _, last_posted = template
+        after = last_posted or start - timedelta(days=1)
+        dates = occurrence_dates(template, after, today)
+        for due in dates:
+            WS.append([description, amount, category, due.strftime("%m/%d/%Y"), "Yes"])
+            _index_description(description, category, 1)
+        if dates:
+            RECURRING_WS.cell(row=row_number, column=8,
+                              value=dates[-1].strftime("%m/%d/%Y"))
+            posted += len(dates)
+    if posted:
+        WB.save("input_data.xlsx")
+        _suggest_for_merchant.cache_clear()
+    return posted
+
+def _template_month_counts(templates, month_starts):
+    """Counts every template's occurrences in every month at once with NumPy.
+
+    Returns a templates x months array; `month_starts` holds one more date than
+    there are months, so the last entry closes the final month.
+    """
+    month_index = np.array([m.year * 12 + m.month - 1 for m in month_starts[:-1]])
+    month_ordinals = np.array([m.toordinal() for m in month_starts])
+    frequencies = np.array([t[3] for t in templates])
+    intervals = np.array([t[4] for t in templates])
+    counts = np.zeros((len(templates), len(month_starts) - 1))
+
+    # Monthly templates: one occurrence every `interval` months from the start
+    # month, up to the last month whose (clamped) day is on or before the end date.
+    monthly = frequencies == "Monthly"
+    if monthly.any():
+        start_index = np.array([t[5].year * 12 + t[5].month - 1
+                                for t in templates if t[3] == "Monthly"])
+        end_index = np.array([
+            t[6].year * 12 + t[6].month - 1
+            - (min(t[5].day, calendar.monthrange(t[6].year, t[6].month)[1]) > t[6].day)
+            if t[6] else month_index[-1]
+            for t in templates if t[3] == "Monthly"
+        ])
+        offset = month_index[None, :] - start_index[:, None]
+        counts[monthly] = ((offset >= 0)
+                           & (offset % intervals[monthly][:, None] == 0)
+                           & (month_index[None, :] <= end_index[:, None]))
+
+    # Weekly/daily templates: count steps from the start landing in each month
+    stepped = ~monthly
+    if stepped.any():
+        starts = np.array([t[5].toordinal() for t in templates])[stepped][:, None]
+        ends = np.array([t[6].toordinal() if t[6] else month_ordinals[-1]
+                         for t in templates])[stepped][:, None]
+        steps = (intervals[stepped]
+                 * np.array([FREQUENCY_DAYS[f] for f in frequencies[stepped]]))[:, None]
+        # Steps before the month's end minus steps before its start, i.e.
+        # ceil((upper - start) / step) - ceil((lower - start) / step)
+        counts[stepped] = np.maximum(
+            (starts - np.maximum(month_ordinals[None, :-1], starts)) // steps
+            - (starts - np.minimum(month_ordinals[None, 1:], ends + 1)) // steps, 0)
+
+    return counts
+
+def _ledger_history(templates, today):
+    """Returns the average monthly net of the ledger and this month's posted net.
+
+    The average leaves out rows posted from a template and hand-entered rows a
+    template covers (same description, or same category and amount), since the
+    templates are projected separately. It spans the completed months from the
+    first such row through last month.
+    """
+    covered_descriptions = {normalize_description(t[0]) for t in templates}
+    covered_amounts = {(t[2], t[1]) for t in templates}
+    current_month = today.year * 12 + today.month - 1
+    history = []
+    this_month_total = 0.0
+    for row in WS.iter_rows(min_row=2, max_col=RECURRING_FLAG_COLUMN, values_only=True):
+        if not row[2] or not isinstance(row[1], (int, float)):
+            continue
+        try:
+            row_date = parse_date(row[3])
+        except ValueError:
+            continue
+        if not row_date:
+            continue
+        row_month = row_date.year * 12 + row_date.month - 1
+        if row_month == current_month:
+            this_month_total += float(row[1])
+        elif (row_month < current_month and not row[4]
+              and normalize_description(row[0]) not in covered_descriptions
+              and (row[2], float(row[1])) not in covered_amounts):
+            history.append((row_month, float(row[1])))
+    if not history:
+        return 0.0, this_month_total
+    months, amounts = np.array(history).T
+    return amounts.sum() / (current_month - months.min()), this_month_total
+
+def forecast_balance(months_ahead=FORECAST_MONTHS):
+    """Projects the monthly balance for this month and the months after it.
+
+    This month's point is what has been posted so far plus the recurring
+    transactions still due before the month ends. Later months add up the
+    recurring transactions and the historical average of everything else.
+    """
+    today = date.today()
+    month_starts = [add_months(today.replace(day=1), i) for i in range(months_ahead + 2)]
+    labels = [month.strftime("%Y-%m") for month in month_starts[:-1]]
+
+    templates = [template for _, template in read_recurring()]
+    projected = np.zeros(months_ahead + 1)
+    if templates:
+        amounts = np.array([t[1] for t in templates])
+        projected[1:] = amounts @ _template_month_counts(templates, month_starts[1:])
+        end_of_month = month_starts[1] - timedelta(days=1)
+        projected[0] = sum(t[1] * len(occurrence_dates(t, today, end_of_month))
+                           for t in templates)
+
+    average, this_month_total = _ledger_history(templates, today)
+    projected[0] += this_month_total
+    projected[1:] += average
+    return labels, projected
+
+def add_recurring(fields):
+    """Validates and stores a recurring transaction template.
+
+    `fields` holds the description, amount, category, frequency, interval, start
+    date and end date as entered, in that order.
+    """
+    description, amount, category, frequency, interval, start_str, end_str = fields
+    amount_value = float(amount)
+    interval_value = int(interval or 1)
+    parse_date(start_str)
+    parse_date(end_str)
+    if frequency not in FREQUENCIES or interval_value < 1:
+        raise ValueError("Invalid frequency or interval")
+    if category.lower() != "income":
+        amount_value = -amount_value  # Expenses are negative
+    RECURRING_WS.append([description, amount_value, category, frequency, interval_value,
+                         start_str, end_str or None, None])
+    WB.save("input_data.xlsx")
+
+def end_recurring(row_number, end_str):
+    """Sets the end date of a recurring template so it stops posting after that day."""
+    parse_date(end_str)
+    RECURRING_WS.cell(row=row_number, column=7, value=end_str)
+    WB.save("input_data.xlsx")
+
+def delete_recurring(row_number):
+    """Deletes a recurring template. Rows it already posted stay in the ledger."""
+    RECURRING_WS.delete_rows(row_number)
+    WB.save("input_data.xlsx")
+
 def save_to_excel():
     """Saves input data to the Excel file."""
     category = category_combo.get()
-    if category.lower() == "income":
+    suggested = not category
+    is_income = category.lower() == "income" or (not category and not description_entry.get())
+    if is_income:
         description = income_description_entry.get()
         amount = income_amount_entry.get()
     else:
         description = description_entry.get()
         amount = amount_entry.get()
+    if not category and description:
+        category = suggest_category(description, income=is_income) or ""
 
     date_str = date_entry.get()
 
@@ -54,7 +400,11 @@ def save_to_excel():
         if category.lower() != "income":
             amount_value = -amount_value  # Expenses are negative
 
-        WS.append([description, amount_value, category, date_str])
+        if suggested:
+            WS.append([description, amount_value, category, date_str, None, "Yes"])
+        else:
+            WS.append([description, amount_value, category, date_str])
+            index_row(description, category)
         WB.save("input_data.xlsx")
         description_entry.delete(0, tk.END)
         amount_entry.delete(0, tk.END)
@@ -98,6 +448,7 @@ def calculate_total():
 
 def update_gui():
     """Updates the GUI by reading data from Excel and recalculating totals."""
+    materialize_recurring()
     read_from_excel()
     calculate_total()
     update_charts_window()
@@ -122,9 +473,59 @@ def export_to_csv():
             date_str = row[3]
             row_date = datetime.strptime(date_str, "%m/%d/%Y")
             if row_date.month == month and row_date.year == year:
-                writer.writerow(row)
+                writer.writerow(row[:4])
     status_label.config(text=f"Data for {month:02}/{year} exported to CSV!")
 
+def import_from_csv():
+    """Imports rows from a CSV file, suggesting categories for rows without one."""
+    file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
+    if not file_path:
+        return
+    imported = []
+    skipped = 0
+    with open(file_path, newline='', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            description = (row.get("Description") or "").strip()
+            category = (row.get("Category") or "").strip()
+            date_str = (row.get("Date") or "").strip()
+            try:
+                amount_value = float(row.get("Amount") or "")
+                datetime.strptime(date_str, "%m/%d/%Y")
+            except ValueError:
+                skipped += 1
+                continue
+            if not description:
+                skipped += 1
+                continue
+            imported.append([description, amount_value, category, date_str])
+
+    # Learn the categories the file gives before suggesting any, so every blank
+    # row sees the whole file, then clear the cache once rather than per row
+    for description, _, category, _ in imported:
+        _index_description(description, category, 1)
+    _suggest_for_merchant.cache_clear()
+
+    # Suggested rows are flagged and not learned from, like those saved by hand
+    suggested = [row for row in imported if not row[2]]
+    for row in suggested:
+        row[2] = suggest_category(row[0], income=row[1] > 0) or "Other"
+        row += [None, "Yes"]
+
+    for row in imported:
+        WS.append(row)
+    WB.save("input_data.xlsx")
+    status_label.config(text=f"Imported {len(imported)} rows ({len(suggested)} "
+                             f"auto-categorized, {skipped} skipped).")
+    update_gui()
+
+def fill_suggested_category(event):
+    """Fills in a suggested category when a description is entered and none is chosen."""
+    description = event.widget.get()
+    if description and not category_combo.get():
+        suggestion = suggest_category(description, income=event.widget is income_description_entry)
+        if suggestion:
+            category_combo.set(suggestion)
+
 def open_charts_window():
     """Opens a new window to display pie and line charts."""
     global chart_window, canvas_pie, canvas_line, ax_pie, ax_line
@@ -154,6 +555,17 @@ def update_charts_window():
     if 'ax_pie' in globals() and 'ax_line' in globals():
         update_charts(ax_pie, ax_line, canvas_pie, canvas_line)
 
+def plot_forecast(axis, dates, balances):
+    """Overlays the balance forecast on the monthly balance chart."""
+    forecast_dates, forecast_balances = forecast_balance()
+    past = [i for i, month in enumerate(dates) if month < forecast_dates[0]]
+    if past:
+        # Join the forecast to the last completed month so the lines meet
+        forecast_dates = [dates[past[-1]]] + forecast_dates
+        forecast_balances = [balances[past[-1]]] + list(forecast_balances)
+    axis.plot(forecast_dates, forecast_balances, label='Forecast', color='#20B2AA',
+              linestyle='--', marker='.')
+
 def update_charts(ax_pie, ax_line, canvas_pie, canvas_line):
     """Updates the pie and line charts with the latest data."""
     categories = {}
@@ -231,6 +643,7 @@ def update_charts(ax_pie, ax_line, canvas_pie, canvas_line):
     balances = [monthly_data[date]['balance'] for date in dates]
 
     ax_line.plot(dates, balances, label='Balance', color='white', marker='o')
+    plot_forecast(ax_line, dates, balances)
 
     ax_line.set_title('Monthly Balance', color='white')
     ax_line.set_xlabel('Month-Year', color='white')
@@ -255,6 +668,96 @@ def update_charts(ax_pie, ax_line, canvas_pie, canvas_line):
     canvas_pie.draw()
     canvas_line.draw()
 
+def open_recurring_window():
+    """Opens a window to add, end, and delete recurring transaction templates."""
+    recurring_window = tk.Toplevel(root)
+    recurring_window.title("Recurring Transactions")
+    recurring_frame = ttk.Frame(recurring_window, padding="10")
+    recurring_frame.grid(row=0, column=0, sticky="nw")
+
+    list_frame = ttk.Frame(recurring_window, padding="10")
+    list_frame.grid(row=0, column=1, sticky="nsew")
+    columns = ("Description", "Amount", "Category", "Frequency", "Every",
+               "Start Date", "End Date")
+    recurring_tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=12)
+    for column in columns:
+        recurring_tree.heading(column, text=column)
+        recurring_tree.column(column, width=90, anchor=tk.CENTER)
+    recurring_tree.grid(row=0, column=0, columnspan=2, sticky="nsew")
+
+    def refresh_recurring():
+        """Reloads the list of templates."""
+        for item in recurring_tree.get_children():
+            recurring_tree.delete(item)
+        for row_number, template in read_recurring():
+            description, amount, category, frequency, interval, start, end, _ = template
+            recurring_tree.insert("", "end", iid=row_number, values=(
+                description, f"{amount:.2f}", category, frequency, interval,
+                start.strftime("%m/%d/%Y"), end.strftime("%m/%d/%Y") if end else ""))
+
+    def end_selected():
+        """Ends the selected template today."""
+        if not recurring_tree.selection():
+            return
+        end_recurring(int(recurring_tree.selection()[0]), datetime.now().strftime("%m/%d/%Y"))
+        refresh_recurring()
+        update_gui()
+
+    def delete_selected():
+        """Deletes the selected template after confirmation."""
+        if not recurring_tree.selection():
+            return
+        if messagebox.askyesno("Delete", "Delete this recurring transaction?",
+                               parent=recurring_window):
+            delete_recurring(int(recurring_tree.selection()[0]))
+            refresh_recurring()
+            update_gui()
+
+    ttk.Button(list_frame, text="End Today", command=end_selected,
+               style='Accent.TButton').grid(row=1, column=0, padx=5, pady=10)
+    ttk.Button(list_frame, text="Delete Recurring", command=delete_selected,
+               style='Accent.TButton').grid(row=1, column=1, padx=5, pady=10)
+
+    fields = {}
+    for i, (name, field) in enumerate([
+            ("Description", ttk.Entry(recurring_frame, width=20)),
+            ("Amount", ttk.Entry(recurring_frame, width=20)),
+            ("Category", ttk.Combobox(recurring_frame, values=categories, width=17)),
+            ("Frequency", ttk.Combobox(recurring_frame, values=FREQUENCIES, width=17)),
+            ("Every (N periods)", ttk.Entry(recurring_frame, width=20)),
+            ("Start Date (MM/DD/YYYY)", ttk.Entry(recurring_frame, width=20)),
+            ("End Date (optional)", ttk.Entry(recurring_frame, width=20))]):
+        ttk.Label(recurring_frame, text=f"{name}:").grid(row=i, column=0, pady=5, padx=10,
+                                                         sticky="w")
+        field.grid(row=i, column=1, pady=5, padx=10, sticky="w")
+        fields[name] = field
+    fields["Frequency"].set("Monthly")
+    fields["Every (N periods)"].insert(0, "1")
+    fields["Start Date (MM/DD/YYYY)"].insert(0, datetime.now().strftime("%m/%d/%Y"))
+
+    def save_recurring():
+        """Stores the entered template and clears its description and amount."""
+        values = tuple(field.get() for field in fields.values())
+        if not all(values[:4]) or not values[5]:
+            messagebox.showerror("Error", "Please enter description, amount, category, "
+                                          "frequency, and start date.")
+            return
+        try:
+            add_recurring(values)
+        except ValueError:
+            messagebox.showerror("Error", "Invalid amount, interval, or date. "
+                                          "Please enter valid values.")
+            return
+        fields["Description"].delete(0, tk.END)
+        fields["Amount"].delete(0, tk.END)
+        status_label.config(text="Recurring transaction saved!")
+        refresh_recurring()
+        update_gui()
+
+    ttk.Button(recurring_frame, text="Save Recurring", command=save_recurring,
+               style='Accent.TButton').grid(row=len(fields), column=0, columnspan=2, pady=10)
+    refresh_recurring()
+
 def on_treeview_double_click(event):
     """Handles double-click event to edit Treeview entries."""
     item_id = tree.selection()[0]
@@ -270,8 +773,17 @@ def on_treeview_double_click(event):
             if column_index == 1:  # Amount column
                 new_value = float(new_value)
             # Update the specific cell in the worksheet
-            WS[int(item_id) + 1][column_index].value = new_value
+            row_number = int(item_id) + 1
+            was_suggested = is_suggested(row_number)
+            WS[row_number][column_index].value = new_value
+            if column_index == 2:  # An edited category is the user's own
+                WS.cell(row=row_number, column=SUGGESTED_FLAG_COLUMN, value=None)
             WB.save("input_data.xlsx")
+            if column_index in (0, 2):  # Description or Category column
+                if not was_suggested:
+                    index_row(item_values[0], item_values[2], -1)
+                if not is_suggested(row_number):
+                    index_row(WS[row_number][0].value, WS[row_number][2].value)
             update_gui()
         except ValueError:
             messagebox.showerror("Error", "Invalid input. Please enter a valid value.")
@@ -281,6 +793,9 @@ def on_treeview_double_click(event):
 def delete_row():
     """Deletes a selected row from the Treeview and Excel sheet."""
     selected_item = tree.selection()[0]
+    item_values = tree.item(selected_item, 'values')
+    if not is_suggested(int(selected_item) + 1):
+        index_row(item_values[0], item_values[2], -1)
     WS.delete_rows(int(selected_item) + 1)
     WB.save("input_data.xlsx")
     update_gui()
@@ -364,6 +879,10 @@ save_button.grid(row=0, column=0, padx=5, pady=5)
 export_button = ttk.Button(button_frame, text="Export to CSV", command=export_to_csv, style='Accent.TButton')
 export_button.grid(row=0, column=1, padx=5, pady=5)
 
+import_button = ttk.Button(button_frame, text="Import CSV", command=import_from_csv,
+                           style='Accent.TButton')
+import_button.grid(row=0, column=5, padx=5, pady=5)
+
 # Add button to open charts window
 chart_button = ttk.Button(button_frame, text="Show Charts", command=open_charts_window, style='Accent.TButton')
 chart_button.grid(row=0, column=2, padx=5, pady=5)
@@ -372,6 +891,11 @@ chart_button.grid(row=0, column=2, padx=5, pady=5)
 delete_button = ttk.Button(button_frame, text="Delete Row", command=delete_row, style='Accent.TButton')
 delete_button.grid(row=0, column=3, padx=5, pady=5)
 
+# Add button to create recurring transactions
+recurring_button = ttk.Button(button_frame, text="Recurring", command=open_recurring_window,
+                              style='Accent.TButton')
+recurring_button.grid(row=0, column=4, padx=5, pady=5)
+
 # Create a frame to hold the Treeview and the chart button
 content_frame = ttk.Frame(root)
 content_frame.grid(row=1, column=0, sticky="nw", padx=10, pady=5)
@@ -416,6 +940,10 @@ for widget in input_chart_frame.winfo_children():
 # Bind Treeview for double-click to edit
 tree.bind("<Double-1>", on_treeview_double_click)
 
+# Suggest a category once a description has been typed
+description_entry.bind("<FocusOut>", fill_suggested_category)
+income_description_entry.bind("<FocusOut>", fill_suggested_category)
+
 # Load the data initially when the application starts
 update_gui()
 